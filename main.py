@@ -5,14 +5,27 @@ Single /chat endpoint for all interactions.
 Supports image uploads for OCR ingredient extraction.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Header, UploadFile, File, Form
 from typing import Optional
-from vertex_agent_entrypoint import get_system
+from vertex_agent_entrypoint import get_system, warmup
 from src.tools.image_ocr import extract_text_from_image, validate_image_format
 import uvicorn
 import os
 
-app = FastAPI(title="FOR ME Agent API", version="2.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initializes the FOR ME system before the server accepts traffic."""
+    warmup()
+    yield
+
+
+app = FastAPI(
+    title="FOR ME Agent API",
+    version="2.0.0",
+    lifespan=lifespan,
+)
 
 
 @app.post("/chat")
@@ -219,8 +232,8 @@ async def chat_with_image(
                 detail=validation.get("error_message", "Invalid image format")
             )
         
-        # Extract text from image using OCR
-        ocr_result = extract_text_from_image(image_data, mime_type)
+        # Extract text from image using OCR (with the detected format)
+        ocr_result = extract_text_from_image(image_data, validation["mime_type"])
         if ocr_result["status"] != "success":
             raise HTTPException(
                 status_code=400,
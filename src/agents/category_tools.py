@@ -168,6 +168,7 @@ def analyze_food_product(
         profile=profile,
         ingredient_risks=ingredient_risks,
         ingredients_list=ingredients_list,
+        ingredients_lower=ingredients_list,  # parser output is already lowercase
     )
 
     # Optionally save context as well — looks good for "context engineering"
@@ -221,6 +222,7 @@ def analyze_cosmetics_product(
         profile=profile,
         ingredient_risks=ingredient_risks,
         ingredients_list=ingredients_list,
+        ingredients_lower=ingredients_list,  # parser output is already lowercase
     )
     
     # Store result in session state for retrieval by orchestrator
@@ -274,6 +276,7 @@ def analyze_household_product(
         profile=profile,
         ingredient_risks=ingredient_risks,
         ingredients_list=ingredients_list,
+        ingredients_lower=ingredients_list,  # parser output is already lowercase
     )
     
     # Store result in session state for retrieval by orchestrator
@@ -17,6 +17,12 @@ from .profile_agent import load_user_profile
 from ..memory import apply_repeated_reactions_to_scores
 
 
+# Dictionary entries with keys lowercased once at import; the scoring loop
+# matches them against lowercased ingredients
+_NEGATIVE_ITEMS = tuple((key.lower(), key, tags) for key, tags in COSMETICS_NEGATIVE.items())
+_POSITIVE_ITEMS = tuple((key.lower(), key, tags) for key, tags in COSMETICS_POSITIVE.items())
+
+
 def build_cosmetics_context(
     profile: Dict[str, Any],
     ingredients_list: List[str],
@@ -67,6 +73,7 @@ def calculate_cosmetics_scores(
     profile: Dict[str, Any],
     ingredient_risks: Dict[str, List[str]],
     ingredients_list: List[str],
+    ingredients_lower: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Calculates scores for COSMETICS products with SOFT logic.
@@ -81,6 +88,8 @@ def calculate_cosmetics_scores(
         profile: User profile with cosmetics_sensitivities, hair_type, hair_goals
         ingredient_risks: Mapping of ingredient -> risk tags
         ingredients_list: List of normalized ingredient names
+        ingredients_lower: Lowercased ingredient names in the same order as
+            ingredients_list (computed here if not provided)
     
     Returns:
         Dictionary with scores and risk analysis
@@ -115,9 +124,12 @@ def calculate_cosmetics_scores(
         elif isinstance(item, str):
             strict_avoid_set.add(item.lower().strip())
     
+    if ingredients_lower is None:
+        ingredients_lower = [ingredient.lower() for ingredient in ingredients_list]
+    sensitivities_lower = [(sens, sens.lower().strip()) for sens in cosmetics_sensitivities]
+    
     # Check each ingredient
-    for ingredient in ingredients_list:
-        ingredient_lower = ingredient.lower()
+    for ingredient, ingredient_lower in zip(ingredients_list, ingredients_lower):
         matched = False
         tags_for_ingredient = ingredient_risks.get(ingredient, [])
 
@@ -159,8 +171,7 @@ def calculate_cosmetics_scores(
         # ---- SENSITIVITY: cosmetics_sensitivities from profile ----
 
         if not matched:
-            for sens in cosmetics_sensitivities:
-                sens_lower = sens.lower().strip()
+            for sens, sens_lower in sensitivities_lower:
                 if sens_lower and (sens_lower in ingredient_lower or ingredient_lower in sens_lower):
                     sensitivity_score = max(0, sensitivity_score - 20)
                     sensitivity_issues.append(
@@ -178,8 +189,8 @@ def calculate_cosmetics_scores(
         # ---- SENSITIVITY: COSMETICS_NEGATIVE dictionary (string match) ----
 
         if not matched:
-            for neg_key, neg_tags in COSMETICS_NEGATIVE.items():
-                if neg_key.lower() in ingredient_lower:
+            for neg_key_lower, neg_key, neg_tags in _NEGATIVE_ITEMS:
+                if neg_key_lower in ingredient_lower:
                     sensitivity_score = max(0, sensitivity_score - 15)
                     sensitivity_issues.append(
                         f"{ingredient}: may be an irritating component ({neg_key})"
@@ -215,8 +226,8 @@ def calculate_cosmetics_scores(
         
         # ---- MATCH: COSMETICS_POSITIVE ----
 
-        for pos_key, pos_tags in COSMETICS_POSITIVE.items():
-            if pos_key.lower() in ingredient_lower:
+        for pos_key_lower, pos_key, pos_tags in _POSITIVE_ITEMS:
+            if pos_key_lower in ingredient_lower:
                 # Check if it matches hair goals
                 if "hydration" in pos_tags and "hydration" in hair_goals:
                     match_score = min(100, match_score + 15)
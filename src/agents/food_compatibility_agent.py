@@ -24,6 +24,12 @@ from .profile_agent import load_user_profile
 from ..memory import apply_repeated_reactions_to_scores
 
 
+# Dictionary entries with keys lowercased once at import; the scoring loop
+# matches them against lowercased ingredients
+_WARN_ITEMS = tuple((key.lower(), key, tags) for key, tags in FOOD_WARN.items())
+_POSITIVE_ITEMS = tuple((key.lower(), key, tags) for key, tags in FOOD_POSITIVE.items())
+
+
 def build_food_context(
     profile: UserProfile,
     ingredients_list: IngredientList,
@@ -70,6 +76,7 @@ def calculate_food_scores(
     profile: UserProfile,
     ingredient_risks: IngredientRisks,
     ingredients_list: IngredientList,
+    ingredients_lower: Optional[IngredientList] = None,
 ) -> ScoreResult:
     """
     Calculates scores for FOOD products with STRICT logic.
@@ -84,6 +91,8 @@ def calculate_food_scores(
         profile: User profile with food_strict_avoid, food_prefer_avoid
         ingredient_risks: Mapping of ingredient -> risk tags
         ingredients_list: List of normalized ingredient names
+        ingredients_lower: Lowercased ingredient names in the same order as
+            ingredients_list (computed here if not provided)
     
     Returns:
         Dictionary with scores and risk analysis
@@ -139,9 +148,11 @@ def calculate_food_scores(
         "msg",
     }
     
+    if ingredients_lower is None:
+        ingredients_lower = [ingredient.lower() for ingredient in ingredients_list]
+    
     # Check each ingredient
-    for ingredient in ingredients_list:
-        ingredient_lower = ingredient.lower()
+    for ingredient, ingredient_lower in zip(ingredients_list, ingredients_lower):
         matched = False
         tags_for_ingredient = ingredient_risks.get(ingredient, [])
         
@@ -207,8 +218,8 @@ def calculate_food_scores(
         # ---- SENSITIVITY: FOOD_WARN dictionary ----
 
         if not matched:
-            for warn_key, warn_tags in FOOD_WARN.items():
-                if warn_key.lower() in ingredient_lower:
+            for warn_key_lower, warn_key, warn_tags in _WARN_ITEMS:
+                if warn_key_lower in ingredient_lower:
                     sensitivity_score = max(0, sensitivity_score - 10)
                     sensitivity_issues.append(
                         f"{ingredient}: contains component from warning zone ({warn_key})"
@@ -243,8 +254,8 @@ def calculate_food_scores(
         
         # ---- MATCH: FOOD_POSITIVE (beneficial components) ----
 
-        for pos_key, pos_tags in FOOD_POSITIVE.items():
-            if pos_key.lower() in ingredient_lower:
+        for pos_key_lower, pos_key, pos_tags in _POSITIVE_ITEMS:
+            if pos_key_lower in ingredient_lower:
                 match_score = min(100, match_score + 10)
                 break
     
@@ -16,6 +16,13 @@ from .profile_agent import load_user_profile
 from ..memory import apply_repeated_reactions_to_scores
 
 
+# Dictionary entries with keys lowercased once at import; the scoring loop
+# matches them against lowercased ingredients
+_RISK_ITEMS = tuple((key.lower(), key, tags) for key, tags in HOUSEHOLD_RISK.items())
+_WARN_ITEMS = tuple((key.lower(), key, tags) for key, tags in HOUSEHOLD_WARN.items())
+_POSITIVE_ITEMS = tuple((key.lower(), key, tags) for key, tags in HOUSEHOLD_POSITIVE.items())
+
+
 def build_household_context(
     profile: Dict[str, Any],
     ingredients_list: List[str],
@@ -61,6 +68,7 @@ def calculate_household_scores(
     profile: Dict[str, Any],
     ingredient_risks: Dict[str, List[str]],
     ingredients_list: List[str],
+    ingredients_lower: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Calculates scores for HOUSEHOLD products with MEDIUM strictness.
@@ -74,6 +82,8 @@ def calculate_household_scores(
         profile: User profile with household_strict_avoid, household_sensitivities
         ingredient_risks: Mapping of ingredient -> risk tags
         ingredients_list: List of normalized ingredient names
+        ingredients_lower: Lowercased ingredient names in the same order as
+            ingredients_list (computed here if not provided)
     
     Returns:
         Dictionary with scores and risk analysis
@@ -103,9 +113,12 @@ def calculate_household_scores(
             strict_avoid_set.add(item.lower().strip())
             strict_avoid_normalized[item.lower().strip()] = {"ingredient": item, "type": "toxic"}
     
+    if ingredients_lower is None:
+        ingredients_lower = [ingredient.lower() for ingredient in ingredients_list]
+    sensitivities_lower = [sens.lower().strip() for sens in household_sensitivities]
+    
     # Check each ingredient
-    for ingredient in ingredients_list:
-        ingredient_lower = ingredient.lower()
+    for ingredient, ingredient_lower in zip(ingredients_list, ingredients_lower):
         matched = False
         
         # Check strict_avoid (affects Safety)
@@ -124,10 +137,10 @@ def calculate_household_scores(
         
         # Check HOUSEHOLD_RISK (only if in strict_avoid)
         if not matched:
-            for risk_key, risk_tags in HOUSEHOLD_RISK.items():
-                if risk_key.lower() in ingredient_lower:
-                    # Only penalize if user has it in strict_avoid
-                    if any(risk_key.lower() in sa.lower() for sa in strict_avoid_set):
+            for risk_key_lower, risk_key, risk_tags in _RISK_ITEMS:
+                if risk_key_lower in ingredient_lower:
+                    # Only penalize if user has it in strict_avoid (entries are lowercased)
+                    if any(risk_key_lower in sa for sa in strict_avoid_set):
                         safety_score = 0
                         final_cap = min(final_cap, 20)
                         from_profile_match.append({
@@ -150,8 +163,7 @@ def calculate_household_scores(
         
         # Check household_sensitivities (affects Sensitivity)
         if not matched:
-            for sens in household_sensitivities:
-                sens_lower = sens.lower().strip()
+            for sens_lower in sensitivities_lower:
                 if sens_lower in ingredient_lower or ingredient_lower in sens_lower:
                     sensitivity_score = max(0, sensitivity_score - 15)
                     from_profile_match.append({
@@ -165,8 +177,8 @@ def calculate_household_scores(
         
         # Check HOUSEHOLD_WARN (affects Sensitivity)
         if not matched:
-            for warn_key, warn_tags in HOUSEHOLD_WARN.items():
-                if warn_key.lower() in ingredient_lower:
+            for warn_key_lower, warn_key, warn_tags in _WARN_ITEMS:
+                if warn_key_lower in ingredient_lower:
                     sensitivity_score = max(0, sensitivity_score - 10)
                     generic_risks.append({
                         "ingredient": ingredient,
@@ -177,8 +189,8 @@ def calculate_household_scores(
                     break
         
         # Check HOUSEHOLD_POSITIVE (affects Match)
-        for pos_key, pos_tags in HOUSEHOLD_POSITIVE.items():
-            if pos_key.lower() in ingredient_lower:
+        for pos_key_lower, pos_key, pos_tags in _POSITIVE_ITEMS:
+            if pos_key_lower in ingredient_lower:
                 match_score = min(100, match_score + 10)
                 break
     
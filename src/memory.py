@@ -345,6 +345,12 @@ def clear_short_term_context(tool_context: ToolContext) -> None:
     tool_context.state["short_term_context"] = copy.deepcopy(SHORT_TERM_CONTEXT_STRUCTURE)
 
 
+# Reaction frequencies grouped by severity
+SEVERE_REACTION_TRIGGERS = frozenset({"always", "every time", "consistently", "constant", "regularly"})
+MODERATE_REACTION_TRIGGERS = frozenset({"often", "frequently", "usually", "many times"})
+MILD_REACTION_TRIGGERS = frozenset({"sometimes", "occasionally", "rarely"})
+
+
 def apply_repeated_reactions_to_scores(
     profile: UserProfile,
     ingredients_list: List[str],
@@ -370,31 +376,34 @@ def apply_repeated_reactions_to_scores(
         Tuple of (updated_safety_score, updated_final_cap)
     """
     repeated_reactions = profile.get("repeated_negative_reactions", [])
+    if not repeated_reactions:
+        return current_safety_score, current_final_cap
+    
+    # Normalize reactions once instead of per (ingredient, reaction) pair
+    # (frequency may be null when the profile comes from the LLM)
+    reactions = [
+        (
+            reaction_entry.get("ingredient", "").lower(),
+            (reaction_entry.get("frequency") or "always").lower().strip(),
+        )
+        for reaction_entry in repeated_reactions
+    ]
     
     for ingredient in ingredients_list:
         ingredient_lower = ingredient.lower()
         
-        for reaction_entry in repeated_reactions:
-            reaction_ingredient = reaction_entry.get("ingredient", "").lower()
-            frequency = reaction_entry.get("frequency", "always")
-            
+        for reaction_ingredient, freq in reactions:
             if reaction_ingredient in ingredient_lower or ingredient_lower in reaction_ingredient:
                 # Repeated negative reaction detected
-                freq = frequency.lower().strip()
-                
-                severe_triggers = ["always", "every time", "consistently", "constant", "regularly"]
-                moderate_triggers = ["often", "frequently", "usually", "many times"]
-                mild_triggers = ["sometimes", "occasionally", "rarely"]
-                
-                if freq in severe_triggers:
+                if freq in SEVERE_REACTION_TRIGGERS:
                     # Severe: Safety = 0, cap = 10
                     current_safety_score = 0
                     current_final_cap = min(current_final_cap, 10)
-                elif freq in moderate_triggers:
+                elif freq in MODERATE_REACTION_TRIGGERS:
                     # Moderate: Safety reduced, cap = 20
                     current_safety_score = min(current_safety_score, 20)
                     current_final_cap = min(current_final_cap, 20)
-                elif freq in mild_triggers:
+                elif freq in MILD_REACTION_TRIGGERS:
                     # Mild: Small penalty
                     current_safety_score = max(0, current_safety_score - 30)
                     current_final_cap = min(current_final_cap, 50)
@@ -31,6 +31,11 @@ from .memory import get_long_term_profile, is_profile_minimal, DEFAULT_EMPTY_PRO
 ONBOARDING_SESSION_PREFIX = "onboarding_"
 ANALYSIS_SESSION_PREFIX = "analysis_"
 
+# Intents reported by handle_chat_request
+INTENT_ONBOARDING_REQUIRED = "ONBOARDING_REQUIRED"
+INTENT_PRODUCT_ANALYSIS = "PRODUCT_ANALYSIS"
+INTENT_SMALL_TALK = "SMALL_TALK"
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +51,17 @@ class ForMeSystem:
     Manages all agents, session service, and provides entry point for analysis.
     """
     
+    # Profile fields that make a profile complete when any of them is non-empty
+    _COMPLETENESS_KEYS = frozenset({
+        "food_strict_avoid",
+        "cosmetics_sensitivities",
+        "household_strict_avoid",
+        "food_prefer_avoid",
+        "hair_goals",
+        "skin_goals",
+        "cosmetics_preferences",
+    })
+    
     def __init__(
         self,
         use_persistent_storage: bool = False,
@@ -136,24 +152,8 @@ class ForMeSystem:
         Returns:
             True if profile is incomplete, False otherwise
         """
-        food_strict_avoid = profile.get("food_strict_avoid", [])
-        cosmetics_sensitivities = profile.get("cosmetics_sensitivities", [])
-        household_strict_avoid = profile.get("household_strict_avoid", [])
-        food_prefer_avoid = profile.get("food_prefer_avoid", [])
-        hair_goals = profile.get("hair_goals", [])
-        skin_goals = profile.get("skin_goals", [])
-        cosmetics_preferences = profile.get("cosmetics_preferences", [])
-        
         # Profile is incomplete if all key fields are empty
-        return (
-            not food_strict_avoid and
-            not cosmetics_sensitivities and
-            not household_strict_avoid and
-            not food_prefer_avoid and
-            not hair_goals and
-            not skin_goals and
-            not cosmetics_preferences
-        )
+        return not any(profile.get(key) for key in self._COMPLETENESS_KEYS)
     
     async def _get_user_profile(self, user_id: str, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -177,8 +177,9 @@ class ForMeSystem:
                 user_id=user_id,
                 session_id=f"{ONBOARDING_SESSION_PREFIX}{user_id}",
             )
-            if profile_key in onboarding_session.state:
-                return onboarding_session.state[profile_key]
+            profile = onboarding_session.state.get(profile_key)
+            if profile is not None:
+                return profile
         except (ValueError, KeyError, AttributeError) as e:
             logger.debug(f"Could not load profile from onboarding session: {e}")
         
@@ -189,8 +190,9 @@ class ForMeSystem:
                 user_id=user_id,
                 session_id=session_id,
             )
-            if profile_key in session.state:
-                return session.state[profile_key]
+            profile = session.state.get(profile_key)
+            if profile is not None:
+                return profile
         except (ValueError, KeyError, AttributeError) as e:
             logger.debug(f"Could not load profile from main session: {e}")
         
@@ -287,7 +289,7 @@ After collecting answers, use save_onboarding_profile tool to save the profile."
                     if hasattr(part, 'text') and part.text:
                         response_parts.append(part.text)
         
-        response_text = "\n".join(response_parts) if response_parts else "Onboarding completed."
+        response_text = "\n".join(response_parts) or "Onboarding completed."
         
         # Check that profile is saved
         final_session = await self.session_service.get_session(
@@ -497,25 +499,24 @@ Then provide final response with:
                 # Get last model output (ADK guarantees last model event is final)
                 for event in reversed(final_session.events):
                     if event.content:
-                        event_text = None
                         if hasattr(event.content, 'parts'):
-                            text_parts = []
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    text_parts.append(part.text)
-                            if text_parts:
-                                event_text = "\n".join(text_parts)
-                        elif hasattr(event.content, 'text') and event.content.text:
-                            event_text = event.content.text
+                            texts = [
+                                part.text for part in event.content.parts or ()
+                                if getattr(part, 'text', None)
+                            ]
+                        else:
+                            texts = [getattr(event.content, 'text', None) or ""]
                         
-                        if event_text and event_text.strip():
+                        # Join once per event; a single part is used as-is
+                        event_text = texts[0] if len(texts) == 1 else "\n".join(texts)
+                        if event_text.strip():
                             response_parts = [event_text]
                             break
                     
             except Exception as e:
                 logger.debug(f"Could not get response from session: {e}")
         
-        response_text = "\n".join(response_parts) if response_parts else "Analysis completed. System processed the request, but final response was not extracted. Please check logs or retry the request."
+        response_text = "\n".join(response_parts) or "Analysis completed. System processed the request, but final response was not extracted. Please check logs or retry the request."
         
         logger.info(f"Analysis complete for user {user_id}")
         
@@ -645,7 +646,7 @@ Then provide final response with:
         if not message and not ingredient_text:
             raise ValueError("Either message or ingredient_text must be provided")
         if product_domain and product_domain not in ["food", "cosmetics", "household"]:
-            logger.warning(f"Invalid product_domain: {product_domain}, will auto-detect")
+            logger.warning("Invalid product_domain: %s, will auto-detect", product_domain)
             product_domain = None
         """
         Main chat entry point for FOR ME system.
@@ -709,11 +710,10 @@ Then provide final response with:
                     user_id=user_id,
                     session_id=f"{ONBOARDING_SESSION_PREFIX}{user_id}",
                 )
-                if profile_key in onboarding_session.state:
+                onboarding_profile = onboarding_session.state.get(profile_key)
+                if onboarding_profile is not None:
                     import copy
-                    session.state[profile_key] = copy.deepcopy(
-                        onboarding_session.state[profile_key]
-                    )
+                    session.state[profile_key] = copy.deepcopy(onboarding_profile)
                     profile_loaded = True
             except Exception:
                 pass
@@ -729,7 +729,7 @@ Then provide final response with:
             profile = get_long_term_profile(temp_context, user_id)
             
             if is_profile_minimal(profile):
-                logger.info(f"Profile is minimal for user {user_id}. Running onboarding first...")
+                logger.info("Profile is minimal for user %s. Running onboarding first...", user_id)
                 # Run onboarding before processing chat request
                 onboarding_result = await self.run_onboarding(
                     user_id=user_id,
@@ -742,14 +742,13 @@ Then provide final response with:
                         user_id=user_id,
                         session_id=f"{ONBOARDING_SESSION_PREFIX}{user_id}",
                     )
-                    if profile_key in onboarding_session.state:
+                    onboarding_profile = onboarding_session.state.get(profile_key)
+                    if onboarding_profile is not None:
                         import copy
-                        session.state[profile_key] = copy.deepcopy(
-                            onboarding_session.state[profile_key]
-                        )
-                        logger.info(f"Profile loaded after onboarding for user {user_id}")
+                        session.state[profile_key] = copy.deepcopy(onboarding_profile)
+                        logger.info("Profile loaded after onboarding for user %s", user_id)
                 except Exception as e:
-                    logger.warning(f"Could not load profile after onboarding: {e}")
+                    logger.warning("Could not load profile after onboarding: %s", e)
         
         # Ensure ingredient_text is ASCII-safe
         if ingredient_text:
@@ -774,9 +773,10 @@ Then provide final response with:
         )
         
         logger.info(
-            f"Chat request for user {user_id}, "
-            f"message_length={len(message or '')}, "
-            f"has_ingredients={bool(ingredient_text)}"
+            "Chat request for user %s, message_length=%d, has_ingredients=%s",
+            user_id,
+            len(message or ''),
+            bool(ingredient_text),
         )
         
         # Run orchestrator
@@ -806,24 +806,23 @@ Then provide final response with:
                 # Get last model output (ADK guarantees last model event is final)
                 for event in reversed(final_session.events):
                     if event.content:
-                        event_text = None
                         if hasattr(event.content, 'parts'):
-                            text_parts = []
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    text_parts.append(part.text)
-                            if text_parts:
-                                event_text = "\n".join(text_parts)
-                        elif hasattr(event.content, 'text') and event.content.text:
-                            event_text = event.content.text
+                            texts = [
+                                part.text for part in event.content.parts or ()
+                                if getattr(part, 'text', None)
+                            ]
+                        else:
+                            texts = [getattr(event.content, 'text', None) or ""]
                         
-                        if event_text and event_text.strip():
+                        # Join once per event; a single part is used as-is
+                        event_text = texts[0] if len(texts) == 1 else "\n".join(texts)
+                        if event_text.strip():
                             response_parts = [event_text]
                             break
             except Exception as e:
-                logger.debug(f"Could not get response from session: {e}")
+                logger.debug("Could not get response from session: %s", e)
         
-        response_text = "\n".join(response_parts) if response_parts else "I received your message. Let me process that for you."
+        response_text = "\n".join(response_parts) or "I received your message. Let me process that for you."
         
         # Try to extract final score and issues if this was a product analysis
         # Category agents store results in session state
@@ -844,18 +843,17 @@ Then provide final response with:
             ]
             
             for key in possible_keys:
-                if key in session.state:
-                    result = session.state[key]
-                    if isinstance(result, dict):
-                        final_score = result.get("for_me_score")
-                        if final_score is not None:
-                            # Keep safety and sensitivity issues separate
-                            safety_issues = result.get("safety_issues", [])
-                            sensitivity_issues = result.get("sensitivity_issues", [])
-                            category = result.get("category")
-                            has_strict_allergen_explicit = result.get("has_strict_allergen_explicit")
-                            has_strict_allergen_traces = result.get("has_strict_allergen_traces")
-                            break
+                result = session.state.get(key)
+                if isinstance(result, dict):
+                    final_score = result.get("for_me_score")
+                    if final_score is not None:
+                        # Keep safety and sensitivity issues separate
+                        safety_issues = result.get("safety_issues", [])
+                        sensitivity_issues = result.get("sensitivity_issues", [])
+                        category = result.get("category")
+                        has_strict_allergen_explicit = result.get("has_strict_allergen_explicit")
+                        has_strict_allergen_traces = result.get("has_strict_allergen_traces")
+                        break
             
             # Also check session events for tool results
             if final_score is None:
@@ -873,14 +871,14 @@ Then provide final response with:
                                 has_strict_allergen_traces = result_data.get("has_strict_allergen_traces")
                                 break
         except (ValueError, KeyError, AttributeError, TypeError) as e:
-            logger.warning(f"Could not extract score: {e}")
+            logger.warning("Could not extract score: %s", e)
         
         # Detect intent (simplified - orchestrator should have done this)
-        intent = "SMALL_TALK"
+        intent = INTENT_SMALL_TALK
         if ingredient_text:
-            intent = "PRODUCT_ANALYSIS"
+            intent = INTENT_PRODUCT_ANALYSIS
         elif final_score is not None:
-            intent = "PRODUCT_ANALYSIS"
+            intent = INTENT_PRODUCT_ANALYSIS
         else:
             # Check if onboarding was triggered
             profile = get_long_term_profile(
@@ -888,31 +886,31 @@ Then provide final response with:
                 user_id
             )
             if is_profile_minimal(profile):
-                intent = "ONBOARDING_REQUIRED"
+                intent = INTENT_ONBOARDING_REQUIRED
         
-        logger.info(f"Chat response for user {user_id}, intent={intent}")
+        logger.info("Chat response for user %s, intent=%s", user_id, intent)
         
         # Build response with only final score (no sub-scores)
         # Internal scores (safety_score, sensitivity_score, match_score) are NOT exposed
+        # Only add score-related fields if this was a product analysis
+        score_fields = {} if final_score is None else {
+            key: value
+            for key, value in (
+                ("for_me_score", final_score),
+                ("safety_issues", safety_issues or None),
+                ("sensitivity_issues", sensitivity_issues or None),
+                ("category", category or None),
+                ("has_strict_allergen_explicit", has_strict_allergen_explicit),
+                ("has_strict_allergen_traces", has_strict_allergen_traces),
+            )
+            if value is not None
+        }
         response = {
             "reply": response_text,
             "intent": intent,
             "status": "success",
+            **score_fields,
         }
         
-        # Only add score-related fields if this was a product analysis
-        if final_score is not None:
-            response["for_me_score"] = final_score
-            if safety_issues:
-                response["safety_issues"] = safety_issues
-            if sensitivity_issues:
-                response["sensitivity_issues"] = sensitivity_issues
-            if category:
-                response["category"] = category
-            if has_strict_allergen_explicit is not None:
-                response["has_strict_allergen_explicit"] = has_strict_allergen_explicit
-            if has_strict_allergen_traces is not None:
-                response["has_strict_allergen_traces"] = has_strict_allergen_traces
-        
         return response
 
@@ -5,6 +5,7 @@ Extracts ingredient text from product images using Gemini Vision API.
 """
 
 import base64
+import functools
 import io
 from typing import Dict, Any, Optional
 import os
@@ -17,6 +18,12 @@ except ImportError:
     GENAI_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "genai.Client":
+    """Returns a Gemini client for the API key, reused across OCR calls."""
+    return genai.Client(api_key=api_key)
+
+
 def extract_text_from_image(image_data: bytes, mime_type: str = "image/jpeg") -> Dict[str, Any]:
     """
     Extracts text from an image using Gemini Vision API.
@@ -45,8 +52,8 @@ def extract_text_from_image(image_data: bytes, mime_type: str = "image/jpeg") ->
                 "error_message": "GOOGLE_API_KEY environment variable not set"
             }
         
-        # Initialize Gemini client
-        client = genai.Client(api_key=api_key)
+        # Reuse the cached Gemini client (keeps its HTTP connection pool)
+        client = _get_client(api_key)
         
         # Prepare prompt for OCR
         prompt = """Extract all ingredient text from this product image.
@@ -122,7 +129,9 @@ def validate_image_format(image_data: bytes, mime_type: str) -> Dict[str, Any]:
         mime_type: MIME type of the image
     
     Returns:
-        Dictionary with validation result
+        Dictionary with validation result.
+        Success: {"status": "success", "mime_type": "<detected MIME type>"}
+        Error: {"status": "error", "error_message": "..."}
     """
     # Supported formats
     supported_formats = ["image/jpeg", "image/jpg", "image/png", "image/webp"]
@@ -147,7 +156,22 @@ def validate_image_format(image_data: bytes, mime_type: str) -> Dict[str, Any]:
             "error_message": "Empty image data"
         }
     
+    # Detect the actual format from the file signature (first 12 bytes)
+    magic = image_data[:12]
+    if magic.startswith(b"\xff\xd8\xff"):
+        actual_mime_type = "image/jpeg"
+    elif magic.startswith(b"\x89PNG\r\n\x1a\n"):
+        actual_mime_type = "image/png"
+    elif magic[:4] == b"RIFF" and magic[8:12] == b"WEBP":
+        actual_mime_type = "image/webp"
+    else:
+        return {
+            "status": "error",
+            "error_message": "Image data is not a valid JPEG, PNG or WebP file"
+        }
+    
     return {
-        "status": "success"
+        "status": "success",
+        "mime_type": actual_mime_type,
     }
 
@@ -4,11 +4,129 @@ Ingredient Parser Tool
 Parses raw ingredient text into normalized list of ingredient names.
 """
 
+import functools
 import re
-from typing import Dict, List
+import sys
+from typing import Dict, List, Tuple
 from google.adk.tools.tool_context import ToolContext
 
 
+# Keywords marking parentheses content worth extracting as an ingredient,
+# compiled once into a single alternation
+PAREN_KEYWORDS = [
+    'содержат', 'contains', 'производные', 'derived',
+    'молок', 'milk', 'dairy', 'соя', 'soy', 'глютен', 'gluten'
+]
+_PAREN_KEYWORD_RE = re.compile('|'.join(map(re.escape, PAREN_KEYWORDS)))
+
+# Ingredient delimiters besides newline (comma, semicolon, bullet points);
+# they are replaced with newlines so a single str.split('\n') separates all
+_DELIMITERS = (',', ';', '•', '·')
+
+# Patterns used on every parse, compiled once at import
+_PAREN_CONTENT_RE = re.compile(r'\(([^)]+)\)')
+_CONTAINS_PREFIX_RE = re.compile(r'.*содержит\s*', re.IGNORECASE)
+_NUMBERING_RE = re.compile(r'^\d+[\.\)]\s*')
+_PERCENT_PAREN_RE = re.compile(r'\s*\([^)]*%[^)]*\)')
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(ingredient_text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], int]:
+    """
+    Parsing core shared by parse_ingredients, cached by the raw text.
+    
+    The same label is often scanned more than once, so repeated texts skip
+    parsing entirely. Results are tuples so cached values stay immutable.
+    
+    Args:
+        ingredient_text: Raw, non-empty ingredient text
+    
+    Returns:
+        Tuple of (ingredients, duplicates_removed, unknown_ingredients, original_count);
+        ingredients is empty if nothing could be parsed
+    """
+    # Split by common delimiters (comma, semicolon, newline, bullet point)
+    # Handle both comma-separated, newline-separated, and bullet-separated lists
+    text = ingredient_text
+    for delimiter in _DELIMITERS:
+        text = text.replace(delimiter, '\n')
+    raw_ingredients = text.split('\n')
+    
+    # Normalize each ingredient
+    normalized = []
+    for ingredient in raw_ingredients:
+        # Strip whitespace and convert to lowercase
+        cleaned = ingredient.strip().lower()
+        
+        # Skip empty strings
+        if not cleaned:
+            continue
+        
+        # Extract important information from parentheses
+        # Example: "flavoring substances (contains dairy derivatives)" 
+        # should also create entry for "dairy derivatives"
+        # (most ingredients have no parentheses, so skip the regex for them)
+        paren_matches = _PAREN_CONTENT_RE.findall(cleaned) if '(' in cleaned else ()
+        for match in paren_matches:
+            # Check if parentheses contain important allergens/ingredients
+            # (text is already lowercased above)
+            if _PAREN_KEYWORD_RE.search(match):
+                # Extract the key ingredient from parentheses
+                # "contains dairy derivatives" -> "dairy derivatives"
+                if 'производные' in match and 'молок' in match:
+                    normalized.append('dairy derivatives')
+                elif 'содержит' in match or 'содержат' in match:
+                    # Extract what comes after "contains"
+                    after_contains = _CONTAINS_PREFIX_RE.sub('', match).strip()
+                    if after_contains:
+                        normalized.append(after_contains)
+        
+        # Remove common prefixes/suffixes that might be formatting artifacts
+        # Remove leading numbers (e.g., "1. water" -> "water");
+        # most ingredients do not start with a digit, so skip the regex for them
+        if cleaned[0].isdecimal():
+            cleaned = _NUMBERING_RE.sub('', cleaned)
+        
+        # Keep parentheses content for now (we'll process it above)
+        # But remove percentage indicators (e.g., "water (50%)" -> "water")
+        cleaned = _PERCENT_PAREN_RE.sub('', cleaned)
+        
+        # Remove extra whitespace
+        cleaned = ' '.join(cleaned.split())
+        
+        if cleaned:
+            normalized.append(cleaned)
+    
+    # QA: detect duplicate ingredients before scoring
+    # Remove exact duplicates while preserving order. Names are interned:
+    # common ones (water, glycerin) recur across labels and are reused as
+    # dict keys by the risk lookup and the scorers
+    deduplicated = list(dict.fromkeys(map(sys.intern, normalized)))
+    
+    # Only walk the list again to report repeats when there are any
+    duplicates = []
+    if len(deduplicated) != len(normalized):
+        seen = set()
+        for ing in normalized:
+            if ing in seen:
+                duplicates.append(ing)
+            else:
+                seen.add(ing)
+    
+    # QA: flag unknown or unparsed tokens
+    # Ingredients that are too short or look like formatting artifacts
+    unknown_ingredients = []
+    for ing in deduplicated:
+        # Flag very short ingredients (likely parsing artifacts)
+        if len(ing) < 2:
+            unknown_ingredients.append(ing)
+        # Flag ingredients that are just numbers or special chars
+        elif ing.replace('.', '').replace('-', '').isdigit():
+            unknown_ingredients.append(ing)
+    
+    return tuple(deduplicated), tuple(duplicates), tuple(unknown_ingredients), len(normalized)
+
+
 def parse_ingredients(tool_context: ToolContext, ingredient_text: str) -> Dict[str, any]:
     """
     Parses raw ingredient text into a normalized list of ingredient names.
@@ -34,92 +152,23 @@ def parse_ingredients(tool_context: ToolContext, ingredient_text: str) -> Dict[s
                 "error_message": "Empty ingredient text provided"
             }
         
-        # Split by common delimiters (comma, semicolon, newline, bullet point)
-        # Handle both comma-separated, newline-separated, and bullet-separated lists
-        raw_ingredients = re.split(r'[,;\n•·]', ingredient_text)
-        
-        # Normalize each ingredient
-        normalized = []
-        for ingredient in raw_ingredients:
-            # Strip whitespace and convert to lowercase
-            cleaned = ingredient.strip().lower()
-            
-            # Skip empty strings
-            if not cleaned:
-                continue
-            
-            # Extract important information from parentheses
-            # Example: "flavoring substances (contains dairy derivatives)" 
-            # should also create entry for "dairy derivatives"
-            paren_matches = re.findall(r'\(([^)]+)\)', cleaned)
-            for match in paren_matches:
-                # Check if parentheses contain important allergens/ingredients
-                if any(keyword in match.lower() for keyword in [
-                    'содержат', 'contains', 'производные', 'derived', 
-                    'молок', 'milk', 'dairy', 'соя', 'soy', 'глютен', 'gluten'
-                ]):
-                    # Extract the key ingredient from parentheses
-                    # "contains dairy derivatives" -> "dairy derivatives"
-                    if 'производные' in match.lower() and 'молок' in match.lower():
-                        normalized.append('dairy derivatives')
-                    elif 'содержит' in match.lower() or 'содержат' in match.lower():
-                        # Extract what comes after "contains"
-                        after_contains = re.sub(r'.*содержит\s*', '', match, flags=re.IGNORECASE).strip()
-                        if after_contains:
-                            normalized.append(after_contains)
-            
-            # Remove common prefixes/suffixes that might be formatting artifacts
-            # Remove leading numbers (e.g., "1. water" -> "water")
-            cleaned = re.sub(r'^\d+[\.\)]\s*', '', cleaned)
-            
-            # Keep parentheses content for now (we'll process it above)
-            # But remove percentage indicators (e.g., "water (50%)" -> "water")
-            cleaned = re.sub(r'\s*\([^)]*%[^)]*\)', '', cleaned)
-            
-            # Remove extra whitespace
-            cleaned = ' '.join(cleaned.split())
-            
-            if cleaned:
-                normalized.append(cleaned)
+        ingredients, duplicates, unknown_ingredients, original_count = _parse_cached(ingredient_text)
         
-        if not normalized:
+        if not ingredients:
             return {
                 "status": "error",
                 "error_message": "No valid ingredients found after parsing"
             }
         
-        # QA: detect duplicate ingredients before scoring
-        # Remove exact duplicates while preserving order
-        seen = set()
-        deduplicated = []
-        duplicates = []
-        for ing in normalized:
-            if ing not in seen:
-                seen.add(ing)
-                deduplicated.append(ing)
-            else:
-                duplicates.append(ing)
-        
-        # QA: flag unknown or unparsed tokens
-        # Ingredients that are too short or look like formatting artifacts
-        unknown_ingredients = []
-        for ing in deduplicated:
-            # Flag very short ingredients (likely parsing artifacts)
-            if len(ing) < 2:
-                unknown_ingredients.append(ing)
-            # Flag ingredients that are just numbers or special chars
-            elif ing.replace('.', '').replace('-', '').isdigit():
-                unknown_ingredients.append(ing)
-        
         return {
             "status": "success",
-            "ingredients": deduplicated,
-            "count": len(deduplicated),
+            "ingredients": list(ingredients),
+            "count": len(ingredients),
             "qa_metadata": {
-                "duplicates_removed": duplicates,
-                "unknown_ingredients": unknown_ingredients,
-                "original_count": len(normalized),
-                "deduplicated_count": len(deduplicated)
+                "duplicates_removed": list(duplicates),
+                "unknown_ingredients": list(unknown_ingredients),
+                "original_count": original_count,
+                "deduplicated_count": len(ingredients)
             }
         }
     
@@ -4,9 +4,20 @@ Risk Dictionary Tool
 Maps ingredient names to risk tags (allergens, irritants, etc.).
 """
 
-from typing import Dict, List, Set
+import functools
+import re
+import sys
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
 from google.adk.tools.tool_context import ToolContext
 
+# Optional: Aho-Corasick automaton for partial matching (pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # Risk dictionary: maps ingredient names to risk tags
 RISK_DICTIONARY = {
@@ -115,6 +126,187 @@ RISK_DICTIONARY = {
 }
 
 
+# Read-only views built once at import: lowercase keys with tags frozen as tuples.
+# Tags are interned so every lookup result shares one string per tag
+_RISK_ITEMS = tuple(
+    (key.lower(), tuple(sys.intern(tag) for tag in tags))
+    for key, tags in RISK_DICTIONARY.items()
+)
+_RISK_TAGS = dict(_RISK_ITEMS)
+
+# Items sorted by key length: a key can only be contained in the ingredient
+# if it is not longer than it
+_ITEMS_BY_LEN = tuple(sorted(_RISK_ITEMS, key=lambda item: len(item[0])))
+_KEY_LENGTHS = tuple(len(key) for key, _ in _ITEMS_BY_LEN)
+
+# ASCII-only partition: an ASCII ingredient cannot contain a Cyrillic key,
+# so it only needs to be checked against these
+_ASCII_ITEMS_BY_LEN = tuple(item for item in _ITEMS_BY_LEN if item[0].isascii())
+_ASCII_KEY_LENGTHS = tuple(len(key) for key, _ in _ASCII_ITEMS_BY_LEN)
+
+# One alternation of all keys. finditer() cannot report overlapping keys
+# ("sodium" inside "sodium lauryl sulfate"), so it is only used to skip the
+# "key in ingredient" scan when no key occurs in the ingredient at all
+_ANY_KEY_RE = re.compile("|".join(re.escape(key) for key, _ in reversed(_ITEMS_BY_LEN)))
+
+
+def _build_automaton():
+    """Compiles all dictionary keys into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for key, tags in _RISK_ITEMS:
+        automaton.add_word(key, (key, tags))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _build_substring_index() -> Dict[str, Tuple[str, ...]]:
+    """
+    Maps every substring of every key to the tags of the keys containing it.
+    
+    This is a flattened suffix trie over the keys: looking up an ingredient
+    returns the tags of all keys it is contained in (a few thousand entries).
+    """
+    index: Dict[str, Set[str]] = {}
+    for key, tags in _RISK_ITEMS:
+        for start in range(len(key) + 1):
+            for end in range(start, len(key) + 1):
+                index.setdefault(key[start:end], set()).update(tags)
+    return {substring: tuple(tags) for substring, tags in index.items()}
+
+
+_SUBSTRING_TAGS = _build_substring_index()
+
+
+def _build_tag_index() -> Dict[str, FrozenSet[str]]:
+    """Maps every tag to the (lowercase) dictionary keys that carry it."""
+    index: Dict[str, Set[str]] = {}
+    for key, tags in _RISK_ITEMS:
+        for tag in tags:
+            index.setdefault(tag, set()).add(key)
+    return {tag: frozenset(keys) for tag, keys in index.items()}
+
+
+_TAG_TO_KEYS = _build_tag_index()
+
+
+def _find_partial_match_tags(ingredient_lower: str) -> Set[str]:
+    """
+    Collects tags of all keys that contain or are contained in the ingredient.
+    
+    Args:
+        ingredient_lower: Lowercased, stripped ingredient name
+    
+    Returns:
+        Set of unique tags
+    """
+    # Ingredient contained in a key: single lookup in the substring index
+    found_tags = set(_SUBSTRING_TAGS.get(ingredient_lower, ()))
+    
+    # Keys contained in the ingredient
+    if _AUTOMATON is not None:
+        # One pass over the ingredient
+        for _, (key, tags) in _AUTOMATON.iter(ingredient_lower):
+            found_tags.update(tags)
+    elif _ANY_KEY_RE.search(ingredient_lower):
+        if ingredient_lower.isascii():
+            items, key_lengths = _ASCII_ITEMS_BY_LEN, _ASCII_KEY_LENGTHS
+        else:
+            items, key_lengths = _ITEMS_BY_LEN, _KEY_LENGTHS
+        for key, tags in items[:bisect_right(key_lengths, len(ingredient_lower))]:
+            if key in ingredient_lower:
+                found_tags.update(tags)
+    return found_tags
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_tags(ingredient_lower: str) -> Tuple[str, ...]:
+    """
+    Returns the risk tags for one normalized ingredient.
+    
+    Results are cached: common ingredients (water, glycerin, fragrance)
+    repeat across products. A tuple is returned so cached values stay immutable.
+    
+    Args:
+        ingredient_lower: Lowercased, stripped ingredient name
+    
+    Returns:
+        Tuple of unique tags (empty if no risks found)
+    """
+    # Check for exact match
+    tags = _RISK_TAGS.get(ingredient_lower)
+    if tags is not None:
+        return tags
+    
+    # Partial match: check if ingredient contains any key
+    # (e.g., "sodium lauryl sulfate" contains "sodium")
+    return tuple(_find_partial_match_tags(ingredient_lower))
+
+
+def keys_for_tag(tag: str) -> FrozenSet[str]:
+    """
+    Returns the dictionary keys that carry a risk tag.
+    
+    Args:
+        tag: Risk tag (e.g. "irritant", "allergen")
+    
+    Returns:
+        Frozenset of lowercase dictionary keys (empty for unknown tags)
+    """
+    return _TAG_TO_KEYS.get(tag, frozenset())
+
+
+def iter_ingredient_risks(ingredients: Iterable[str]) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+    """
+    Lazily yields (ingredient, tags) pairs for a sequence of ingredients.
+    
+    Useful when only aggregate information is needed (e.g. the union of
+    all tags) and the full ingredient -> tags mapping does not have to be
+    kept in memory.
+    
+    Args:
+        ingredients: Ingredient names (normalized with lower() and strip())
+    
+    Yields:
+        Tuples of (original ingredient name, tuple of risk tags)
+    """
+    for ingredient in ingredients:
+        yield ingredient, _lookup_tags(ingredient.lower().strip())
+
+
+@functools.lru_cache(maxsize=512)
+def _risks_cached(
+    ingredients: Tuple[str, ...],
+) -> Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[str, ...], int]:
+    """
+    Risk mapping for a whole ingredient list, cached by the list.
+    
+    The same product is often analyzed more than once in a session, so a
+    repeated list skips the per-ingredient lookups. Results are tuples so
+    cached values stay immutable.
+    
+    Args:
+        ingredients: Ingredient names in their original order
+    
+    Returns:
+        Tuple of (ingredient -> tags pairs, sorted unique tags, ingredients_with_risks)
+    """
+    risks: Dict[str, Tuple[str, ...]] = {}
+    all_tags: Set[str] = set()
+    ingredients_with_risks = 0
+    
+    for ingredient, tags in iter_ingredient_risks(ingredients):
+        if tags:
+            if ingredient not in risks:
+                ingredients_with_risks += 1
+            all_tags.update(tags)
+        risks[ingredient] = tags
+    
+    return tuple(risks.items()), tuple(sorted(all_tags)), ingredients_with_risks
+
+
 def get_ingredient_risks(tool_context: ToolContext, ingredients: List[str]) -> Dict[str, any]:
     """
     Maps a list of normalized ingredient names to their risk tags.
@@ -145,39 +337,25 @@ def get_ingredient_risks(tool_context: ToolContext, ingredients: List[str]) -> D
                 "error_message": "Empty ingredients list provided"
             }
         
-        risks = {}
-        all_tags = set()
+        if len(ingredients) == 1:
+            # Single ingredient: tags are already unique, no set needed
+            ingredient = ingredients[0]
+            tags = _lookup_tags(ingredient.lower().strip())
+            return {
+                "status": "success",
+                "risks": {ingredient: list(tags)},
+                "all_risk_tags": sorted(tags),
+                "ingredients_with_risks": 1 if tags else 0,
+                "total_ingredients": 1
+            }
         
-        for ingredient in ingredients:
-            # Direct lookup
-            ingredient_lower = ingredient.lower().strip()
-            
-            # Check for exact match
-            if ingredient_lower in RISK_DICTIONARY:
-                tags = RISK_DICTIONARY[ingredient_lower]
-                risks[ingredient] = tags
-                all_tags.update(tags)
-            else:
-                # Partial match: check if ingredient contains any key
-                # (e.g., "sodium lauryl sulfate" contains "sls")
-                found_tags = []
-                for key, tags in RISK_DICTIONARY.items():
-                    if key in ingredient_lower or ingredient_lower in key:
-                        found_tags.extend(tags)
-                
-                if found_tags:
-                    # Deduplicate
-                    risks[ingredient] = list(set(found_tags))
-                    all_tags.update(found_tags)
-                else:
-                    # No risks found for this ingredient
-                    risks[ingredient] = []
+        risk_items, all_tags, ingredients_with_risks = _risks_cached(tuple(ingredients))
         
         return {
             "status": "success",
-            "risks": risks,
-            "all_risk_tags": sorted(list(all_tags)),
-            "ingredients_with_risks": len([i for i, tags in risks.items() if tags]),
+            "risks": {ingredient: list(tags) for ingredient, tags in risk_items},
+            "all_risk_tags": list(all_tags),
+            "ingredients_with_risks": ingredients_with_risks,
             "total_ingredients": len(ingredients)
         }
     
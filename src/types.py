@@ -5,8 +5,11 @@ This module provides type aliases and TypedDict classes for better type safety
 and code clarity throughout the system.
 """
 
-from typing import Dict, List, Optional, Union, Any, TypedDict
-from google.adk.tools.tool_context import ToolContext
+from typing import Dict, List, Optional, Union, Any, TypedDict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only used in annotations; avoids importing ADK when loading the types
+    from google.adk.tools.tool_context import ToolContext
 
 
 # ============================================================================
@@ -207,7 +210,7 @@ def calculate_scores_signature(
 
 
 def update_long_term_profile_signature(
-    tool_context: ToolContext,
+    tool_context: "ToolContext",
     user_id: str,
     updates: ProfileUpdate,
 ) -> UserProfile:
@@ -3,7 +3,8 @@ Pytest configuration and fixtures for FOR ME tests.
 """
 
 import pytest
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from copy import deepcopy
 from src.memory import DEFAULT_EMPTY_PROFILE
 
@@ -14,10 +15,10 @@ def empty_profile() -> Dict[str, Any]:
     return deepcopy(DEFAULT_EMPTY_PROFILE)
 
 
-@pytest.fixture
-def sample_food_profile() -> Dict[str, Any]:
-    """Returns a sample food profile with allergies and preferences."""
-    return {
+@pytest.fixture(scope="session")
+def sample_food_profile() -> Mapping[str, Any]:
+    """Returns a read-only sample food profile with allergies and preferences."""
+    return MappingProxyType({
         "food_strict_avoid": [
             {"ingredient": "hazelnut", "type": "allergen"},
             {"ingredient": "peanut", "type": "allergen"},
@@ -38,13 +39,13 @@ def sample_food_profile() -> Dict[str, Any]:
         "cosmetics_preferences": [],
         "household_strict_avoid": [],
         "household_sensitivities": [],
-    }
+    })
 
 
-@pytest.fixture
-def sample_cosmetics_profile() -> Dict[str, Any]:
-    """Returns a sample cosmetics profile with sensitivities."""
-    return {
+@pytest.fixture(scope="session")
+def sample_cosmetics_profile() -> Mapping[str, Any]:
+    """Returns a read-only sample cosmetics profile with sensitivities."""
+    return MappingProxyType({
         "cosmetics_sensitivities": ["fragrance", "SLS", "drying_alcohol"],
         "cosmetics_preferences": ["silicone_free"],
         "hair_type": "curly",
@@ -57,32 +58,41 @@ def sample_cosmetics_profile() -> Dict[str, Any]:
         "repeated_negative_reactions": [],
         "household_strict_avoid": [],
         "household_sensitivities": [],
-    }
+    })
 
 
-@pytest.fixture
-def sample_ingredient_risks() -> Dict[str, list]:
-    """Returns sample ingredient risk mappings."""
-    return {
+@pytest.fixture(scope="session")
+def sample_household_profile() -> Mapping[str, Any]:
+    """Returns a read-only sample household profile with strict avoids and sensitivities."""
+    return MappingProxyType(deepcopy(DEFAULT_EMPTY_PROFILE) | {
+        "household_strict_avoid": ["bleach"],
+        "household_sensitivities": ["ammonia"],
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_ingredient_risks() -> Mapping[str, list]:
+    """Returns read-only sample ingredient risk mappings."""
+    return MappingProxyType({
         "sodium lauryl sulfate": ["harsh_surfactant", "irritant"],
         "fragrance": ["fragrance", "irritant"],
         "parabens": ["preservative", "controversial"],
         "sugar": ["high_sugar"],
         "salt": ["high_salt"],
         "gluten": ["allergen"],
-    }
+    })
 
 
-@pytest.fixture
-def sample_ingredients_list() -> list:
-    """Returns a sample normalized ingredients list."""
-    return [
+@pytest.fixture(scope="session")
+def sample_ingredients_list() -> tuple:
+    """Returns a sample normalized ingredients list (read-only tuple)."""
+    return (
         "water",
         "sodium lauryl sulfate",
         "glycerin",
         "fragrance",
         "cocoa butter",
-    ]
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,14 @@
+"""
+Pytest fixtures shared by the unit tests.
+
+Data fixtures (profiles, ingredients, risks) live in tests/conftest.py.
+"""
+
+import pytest
+from src.system import ForMeSystem
+
+
+@pytest.fixture(scope="session")
+def system() -> ForMeSystem:
+    """Returns a shared in-memory ForMeSystem (only used for stateless helpers)."""
+    return ForMeSystem(use_persistent_storage=False)
@@ -2,6 +2,8 @@
 Unit tests for memory functions.
 """
 
+from copy import deepcopy
+
 import pytest
 from src.memory import (
     is_profile_minimal,
@@ -11,6 +13,11 @@ from src.memory import (
 )
 
 
+def make_profile(**overrides):
+    """Returns a fresh empty profile with the given fields set."""
+    return deepcopy(DEFAULT_EMPTY_PROFILE) | overrides
+
+
 class TestIsProfileMinimal:
     """Tests for is_profile_minimal function."""
     
@@ -22,160 +29,120 @@ class TestIsProfileMinimal:
         """None profile should be considered minimal."""
         assert is_profile_minimal(None) is True
     
-    def test_profile_with_food_strict_avoid_not_minimal(self, empty_profile):
-        """Profile with food_strict_avoid should not be minimal."""
-        profile = empty_profile.copy()
-        profile["food_strict_avoid"] = [{"ingredient": "peanut", "type": "allergen"}]
-        assert is_profile_minimal(profile) is False
-    
-    def test_profile_with_hair_type_not_minimal(self, empty_profile):
-        """Profile with hair_type should not be minimal."""
-        profile = empty_profile.copy()
-        profile["hair_type"] = "curly"
-        assert is_profile_minimal(profile) is False
-    
-    def test_profile_with_hair_goals_not_minimal(self, empty_profile):
-        """Profile with hair_goals should not be minimal."""
-        profile = empty_profile.copy()
-        profile["hair_goals"] = ["hydration"]
-        assert is_profile_minimal(profile) is False
-    
-    def test_profile_with_skin_goals_not_minimal(self, empty_profile):
-        """Profile with skin_goals should not be minimal."""
-        profile = empty_profile.copy()
-        profile["skin_goals"] = ["hydration"]
-        assert is_profile_minimal(profile) is False
-    
-    def test_profile_with_repeated_reactions_not_minimal(self, empty_profile):
-        """Profile with repeated_negative_reactions should not be minimal."""
-        profile = empty_profile.copy()
-        profile["repeated_negative_reactions"] = [
-            {"ingredient": "SLS", "reaction": "itching", "frequency": "always"}
-        ]
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("food_strict_avoid", [{"ingredient": "peanut", "type": "allergen"}]),
+            ("hair_type", "curly"),
+            ("hair_goals", ["hydration"]),
+            ("skin_goals", ["hydration"]),
+            ("repeated_negative_reactions", [
+                {"ingredient": "SLS", "reaction": "itching", "frequency": "always"}
+            ]),
+        ],
+    )
+    def test_profile_with_field_not_minimal(self, field, value):
+        """Profile with any meaningful field set should not be minimal."""
+        profile = make_profile(**{field: value})
         assert is_profile_minimal(profile) is False
 
 
 class TestApplyRepeatedReactionsToScores:
     """Tests for apply_repeated_reactions_to_scores function."""
     
-    def test_no_reactions_no_change(self, empty_profile):
-        """No repeated reactions should not change scores."""
-        safety_score = 100
-        final_cap = 100
-        ingredients = ["water", "glycerin"]
-        
-        new_safety, new_cap = apply_repeated_reactions_to_scores(
-            profile=empty_profile,
-            ingredients_list=ingredients,
-            current_safety_score=safety_score,
-            current_final_cap=final_cap,
-        )
-        
-        assert new_safety == safety_score
-        assert new_cap == final_cap
-    
-    def test_severe_reaction_lowers_safety(self, empty_profile):
-        """Severe reaction (always) should lower safety score."""
-        profile = empty_profile.copy()
-        profile["repeated_negative_reactions"] = [
-            {
-                "ingredient": "sodium lauryl sulfate",
-                "reaction": "itching",
-                "frequency": "always",
-            }
-        ]
-        
-        safety_score = 100
-        final_cap = 100
-        ingredients = ["water", "sodium lauryl sulfate", "glycerin"]
-        
-        new_safety, new_cap = apply_repeated_reactions_to_scores(
-            profile=profile,
-            ingredients_list=ingredients,
-            current_safety_score=safety_score,
-            current_final_cap=final_cap,
-        )
-        
-        assert new_safety < safety_score
-        assert new_cap < final_cap
-    
-    def test_moderate_reaction_moderate_penalty(self, empty_profile):
-        """Moderate reaction (often) should apply moderate penalty."""
-        profile = empty_profile.copy()
-        profile["repeated_negative_reactions"] = [
-            {
-                "ingredient": "fragrance",
-                "reaction": "redness",
-                "frequency": "often",
-            }
-        ]
-        
-        safety_score = 100
-        final_cap = 100
-        ingredients = ["water", "fragrance", "glycerin"]
-        
-        new_safety, new_cap = apply_repeated_reactions_to_scores(
-            profile=profile,
-            ingredients_list=ingredients,
-            current_safety_score=safety_score,
-            current_final_cap=final_cap,
-        )
-        
-        assert new_safety < safety_score
-        assert new_cap < final_cap
-        # Moderate should be less severe than "always"
-        assert new_safety > 0  # Not zero like severe
-    
-    def test_mild_reaction_small_penalty(self, empty_profile):
-        """Mild reaction (sometimes) should apply small penalty."""
-        profile = empty_profile.copy()
-        profile["repeated_negative_reactions"] = [
-            {
-                "ingredient": "alcohol",
-                "reaction": "dryness",
-                "frequency": "sometimes",
-            }
-        ]
-        
-        safety_score = 100
-        final_cap = 100
-        ingredients = ["water", "alcohol", "glycerin"]
+    @pytest.mark.parametrize(
+        "reaction,ingredients,safety_range,cap_range",
+        [
+            # No repeated reactions: scores unchanged
+            (None, ["water", "glycerin"], (100, 100), (100, 100)),
+            # Severe reaction (always): safety and cap lowered
+            (
+                {"ingredient": "sodium lauryl sulfate", "reaction": "itching", "frequency": "always"},
+                ["water", "sodium lauryl sulfate", "glycerin"],
+                (0, 99),
+                (0, 99),
+            ),
+            # Moderate reaction (often): lowered, but not to zero like severe
+            (
+                {"ingredient": "fragrance", "reaction": "redness", "frequency": "often"},
+                ["water", "fragrance", "glycerin"],
+                (1, 99),
+                (0, 99),
+            ),
+            # Mild reaction (sometimes): small penalty, still relatively high
+            (
+                {"ingredient": "alcohol", "reaction": "dryness", "frequency": "sometimes"},
+                ["water", "alcohol", "glycerin"],
+                (51, 99),
+                (0, 100),
+            ),
+            # Reaction to an ingredient not in the product: scores unchanged
+            (
+                {"ingredient": "SLS", "reaction": "itching", "frequency": "always"},
+                ["water", "glycerin"],
+                (100, 100),
+                (100, 100),
+            ),
+            # Null frequency, ingredient not in the product: scores unchanged
+            (
+                {"ingredient": "sls", "frequency": None},
+                ["water"],
+                (100, 100),
+                (100, 100),
+            ),
+            # Null frequency, empty product: scores unchanged
+            ({"ingredient": "sls", "frequency": None}, [], (100, 100), (100, 100)),
+            # Null frequency on a match: treated like a missing frequency (always)
+            (
+                {"ingredient": "sls", "frequency": None},
+                ["water", "sls"],
+                (0, 0),
+                (0, 10),
+            ),
+        ],
+        ids=[
+            "no_reactions",
+            "severe",
+            "moderate",
+            "mild",
+            "not_in_ingredients",
+            "null_frequency_no_match",
+            "null_frequency_empty_product",
+            "null_frequency_match",
+        ],
+    )
+    def test_reaction_adjusts_scores(self, reaction, ingredients, safety_range, cap_range):
+        """Repeated reactions should lower scores according to their frequency."""
+        profile = make_profile(repeated_negative_reactions=[reaction] if reaction else [])
         
         new_safety, new_cap = apply_repeated_reactions_to_scores(
             profile=profile,
             ingredients_list=ingredients,
-            current_safety_score=safety_score,
-            current_final_cap=final_cap,
+            current_safety_score=100,
+            current_final_cap=100,
         )
         
-        assert new_safety < safety_score
-        # Mild should be less severe than moderate
-        assert new_safety > 50  # Still relatively high
-    
-    def test_reaction_not_in_ingredients_no_change(self, empty_profile):
-        """Reaction to ingredient not in list should not change scores."""
-        profile = empty_profile.copy()
-        profile["repeated_negative_reactions"] = [
-            {
-                "ingredient": "SLS",
-                "reaction": "itching",
-                "frequency": "always",
-            }
+        assert safety_range[0] <= new_safety <= safety_range[1]
+        assert cap_range[0] <= new_cap <= cap_range[1]
+    
+    @pytest.mark.slow
+    def test_large_input_scales(self):
+        """Many unrelated reactions against a long ingredient list leave scores unchanged."""
+        ingredients = [f"ingredient {i}" for i in range(1000)]
+        reactions = [
+            {"ingredient": f"allergen {i}", "reaction": "itching", "frequency": "often"}
+            for i in range(100)
         ]
-        
-        safety_score = 100
-        final_cap = 100
-        ingredients = ["water", "glycerin"]  # No SLS
+        profile = make_profile(repeated_negative_reactions=reactions)
         
         new_safety, new_cap = apply_repeated_reactions_to_scores(
             profile=profile,
             ingredients_list=ingredients,
-            current_safety_score=safety_score,
-            current_final_cap=final_cap,
+            current_safety_score=100,
+            current_final_cap=100,
         )
         
-        assert new_safety == safety_score
-        assert new_cap == final_cap
+        assert (new_safety, new_cap) == (100, 100)
 
 
 class TestEnsureList:
@@ -2,10 +2,39 @@
 Unit tests for scoring functions.
 """
 
+from copy import deepcopy
+
 import pytest
 from src.agents.food_compatibility_agent import calculate_food_scores
 from src.agents.cosmetics_compatibility_agent import calculate_cosmetics_scores
 from src.agents.household_compatibility_agent import calculate_household_scores
+from src.memory import DEFAULT_EMPTY_PROFILE
+
+
+def assert_scoring_shape(
+    result,
+    *,
+    safety_eq=None,
+    safety_lt=None,
+    safety_min=None,
+    sensitivity_lt=None,
+    sensitivity_min=None,
+    for_me_min=None,
+):
+    """Asserts a successful scoring result and the given score bounds."""
+    assert result["status"] == "success"
+    if safety_eq is not None:
+        assert result["safety_score"] == safety_eq
+    if safety_lt is not None:
+        assert result["safety_score"] < safety_lt
+    if safety_min is not None:
+        assert result["safety_score"] >= safety_min
+    if sensitivity_lt is not None:
+        assert result["sensitivity_score"] < sensitivity_lt
+    if sensitivity_min is not None:
+        assert result["sensitivity_score"] >= sensitivity_min
+    if for_me_min is not None:
+        assert result["for_me_score"] >= for_me_min
 
 
 class TestFoodScoring:
@@ -25,8 +54,7 @@ class TestFoodScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] == 0
+        assert_scoring_shape(result, safety_eq=0)
         assert result["final_cap"] <= 15
         assert result["has_strict_allergen_explicit"] is True
         assert len(result["safety_issues"]) > 0
@@ -44,9 +72,7 @@ class TestFoodScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] < 100
-        assert result["safety_score"] >= 20  # Traces penalty
+        assert_scoring_shape(result, safety_lt=100, safety_min=20)  # Traces penalty
         assert result["has_strict_allergen_traces"] is True
     
     def test_prefer_avoid_affects_sensitivity(self, sample_food_profile):
@@ -62,27 +88,10 @@ class TestFoodScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] == 100  # Safety not affected
-        assert result["sensitivity_score"] < 100  # Sensitivity affected
+        # Safety not affected, sensitivity affected
+        assert_scoring_shape(result, safety_eq=100, sensitivity_lt=100)
         assert len(result["sensitivity_issues"]) > 0
     
-    def test_no_issues_high_scores(self, sample_food_profile):
-        """Product with no issues should have high scores."""
-        ingredients = ["water", "cocoa", "vanilla"]
-        ingredient_risks = {}
-        
-        result = calculate_food_scores(
-            profile=sample_food_profile,
-            ingredient_risks=ingredient_risks,
-            ingredients_list=ingredients,
-        )
-        
-        assert result["status"] == "success"
-        assert result["safety_score"] == 100
-        assert result["sensitivity_score"] >= 90
-        assert result["for_me_score"] >= 80
-    
     def test_risk_tags_affect_sensitivity(self, sample_food_profile):
         """Risk tags (high_salt, high_sugar) should affect sensitivity."""
         ingredients = ["water", "salt", "sugar"]
@@ -97,18 +106,39 @@ class TestFoodScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["sensitivity_score"] < 100
+        assert_scoring_shape(result, sensitivity_lt=100)
         assert len(result["sensitivity_issues"]) > 0
 
 
+    def test_precomputed_lowercase_matches(self, sample_food_profile):
+        """Passing ingredients_lower should not change the result."""
+        ingredients = ["Water", "HAZELNUT", "Sugar"]
+        ingredient_risks = {"Sugar": ["high_sugar"]}
+        
+        result = calculate_food_scores(
+            profile=sample_food_profile,
+            ingredient_risks=ingredient_risks,
+            ingredients_list=ingredients,
+        )
+        precomputed = calculate_food_scores(
+            profile=sample_food_profile,
+            ingredient_risks=ingredient_risks,
+            ingredients_list=ingredients,
+            ingredients_lower=[ingredient.lower() for ingredient in ingredients],
+        )
+        
+        assert precomputed == result
+        assert_scoring_shape(result, safety_eq=0, sensitivity_lt=100)
+
+
 class TestCosmeticsScoring:
     """Tests for cosmetics product scoring."""
     
     def test_strict_avoid_lowers_safety(self, sample_cosmetics_profile):
         """Strict_avoid in cosmetics should lower safety."""
-        profile = sample_cosmetics_profile.copy()
-        profile["strict_avoid"] = [{"ingredient": "sodium lauryl sulfate", "type": "allergen"}]
+        profile = sample_cosmetics_profile | {
+            "strict_avoid": [{"ingredient": "sodium lauryl sulfate", "type": "allergen"}],
+        }
         
         ingredients = ["water", "sodium lauryl sulfate", "glycerin"]
         ingredient_risks = {
@@ -121,8 +151,7 @@ class TestCosmeticsScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] < 100
+        assert_scoring_shape(result, safety_lt=100)
         assert len(result["safety_issues"]) > 0
     
     def test_sensitivities_affect_sensitivity_score(self, sample_cosmetics_profile):
@@ -138,9 +167,8 @@ class TestCosmeticsScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] == 100  # Safety not affected
-        assert result["sensitivity_score"] < 100  # Sensitivity affected
+        # Safety not affected, sensitivity affected
+        assert_scoring_shape(result, safety_eq=100, sensitivity_lt=100)
         assert len(result["sensitivity_issues"]) > 0
     
     def test_hair_goals_affect_match(self, sample_cosmetics_profile):
@@ -157,24 +185,8 @@ class TestCosmeticsScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
+        assert_scoring_shape(result)
         assert result["match_score"] > 50  # Should be boosted by hydration goal
-    
-    def test_no_issues_high_scores(self, sample_cosmetics_profile):
-        """Product with no issues should have high scores."""
-        ingredients = ["water", "glycerin", "dimethicone"]
-        ingredient_risks = {}
-        
-        result = calculate_cosmetics_scores(
-            profile=sample_cosmetics_profile,
-            ingredient_risks=ingredient_risks,
-            ingredients_list=ingredients,
-        )
-        
-        assert result["status"] == "success"
-        assert result["safety_score"] == 100
-        assert result["sensitivity_score"] >= 90
-        assert result["for_me_score"] >= 80
 
 
 class TestHouseholdScoring:
@@ -182,19 +194,8 @@ class TestHouseholdScoring:
     
     def test_strict_avoid_lowers_safety(self):
         """Strict_avoid in household should lower safety."""
-        profile = {
+        profile = deepcopy(DEFAULT_EMPTY_PROFILE) | {
             "household_strict_avoid": ["sodium hypochlorite", "bleach"],
-            "household_sensitivities": [],
-            "food_strict_avoid": [],
-            "food_prefer_avoid": [],
-            "food_ok_if_small": [],
-            "cosmetics_sensitivities": [],
-            "cosmetics_preferences": [],
-            "repeated_negative_reactions": [],
-            "hair_type": None,
-            "hair_goals": [],
-            "skin_type": None,
-            "skin_goals": [],
         }
         
         ingredients = ["water", "sodium hypochlorite", "surfactant"]
@@ -208,26 +209,14 @@ class TestHouseholdScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] < 100
+        assert_scoring_shape(result, safety_lt=100)
         # Household agent returns risk_analysis, not safety_issues
         assert "risk_analysis" in result or "safety_issues" in result
     
     def test_sensitivities_affect_sensitivity(self):
         """Household sensitivities should affect sensitivity_score."""
-        profile = {
-            "household_strict_avoid": [],
+        profile = deepcopy(DEFAULT_EMPTY_PROFILE) | {
             "household_sensitivities": ["ammonia", "strong_solvents"],
-            "food_strict_avoid": [],
-            "food_prefer_avoid": [],
-            "food_ok_if_small": [],
-            "cosmetics_sensitivities": [],
-            "cosmetics_preferences": [],
-            "repeated_negative_reactions": [],
-            "hair_type": None,
-            "hair_goals": [],
-            "skin_type": None,
-            "skin_goals": [],
         }
         
         ingredients = ["water", "ammonia", "surfactant"]
@@ -241,39 +230,31 @@ class TestHouseholdScoring:
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["sensitivity_score"] < 100
+        assert_scoring_shape(result, sensitivity_lt=100)
         # Household agent may not return sensitivity_issues, check risk_analysis instead
         assert "risk_analysis" in result or "sensitivity_issues" in result
+
+
+class TestNoIssuesScoring:
+    """Tests shared by all category scorers."""
     
-    def test_no_issues_high_scores(self):
+    @pytest.mark.parametrize(
+        "scorer,profile_fixture,ingredients",
+        [
+            (calculate_food_scores, "sample_food_profile", ["water", "cocoa", "vanilla"]),
+            (calculate_cosmetics_scores, "sample_cosmetics_profile", ["water", "glycerin", "dimethicone"]),
+            (calculate_household_scores, "sample_household_profile", ["water", "surfactant", "glycerin"]),
+        ],
+        ids=["food", "cosmetics", "household"],
+    )
+    def test_no_issues_high_scores(self, request, scorer, profile_fixture, ingredients):
         """Product with no issues should have high scores."""
-        profile = {
-            "household_strict_avoid": [],
-            "household_sensitivities": [],
-            "food_strict_avoid": [],
-            "food_prefer_avoid": [],
-            "food_ok_if_small": [],
-            "cosmetics_sensitivities": [],
-            "cosmetics_preferences": [],
-            "repeated_negative_reactions": [],
-            "hair_type": None,
-            "hair_goals": [],
-            "skin_type": None,
-            "skin_goals": [],
-        }
-        
-        ingredients = ["water", "surfactant", "glycerin"]
-        ingredient_risks = {}
+        profile = request.getfixturevalue(profile_fixture)
         
-        result = calculate_household_scores(
+        result = scorer(
             profile=profile,
-            ingredient_risks=ingredient_risks,
+            ingredient_risks={},
             ingredients_list=ingredients,
         )
         
-        assert result["status"] == "success"
-        assert result["safety_score"] == 100
-        assert result["sensitivity_score"] >= 90
-        assert result["for_me_score"] >= 80
-
+        assert_scoring_shape(result, safety_eq=100, sensitivity_min=90, for_me_min=80)
@@ -2,62 +2,61 @@
 Unit tests for system helper functions.
 """
 
-import pytest
 from src.system import ForMeSystem
 
 
 class TestIsProfileIncomplete:
     """Tests for _is_profile_incomplete helper function."""
     
-    def test_empty_profile_is_incomplete(self):
+    def test_empty_profile_is_incomplete(self, system):
         """Empty profile should be considered incomplete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {}
         
         assert system._is_profile_incomplete(profile) is True
     
-    def test_profile_with_food_strict_avoid_is_complete(self):
+    def test_profile_with_food_strict_avoid_is_complete(self, system):
         """Profile with food_strict_avoid should be complete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {
             "food_strict_avoid": [{"ingredient": "peanut", "type": "allergen"}],
         }
         
         assert system._is_profile_incomplete(profile) is False
     
-    def test_profile_with_cosmetics_sensitivities_is_complete(self):
+    def test_profile_with_cosmetics_sensitivities_is_complete(self, system):
         """Profile with cosmetics_sensitivities should be complete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {
             "cosmetics_sensitivities": ["fragrance"],
         }
         
         assert system._is_profile_incomplete(profile) is False
     
-    def test_profile_with_hair_goals_is_complete(self):
+    def test_profile_with_hair_goals_is_complete(self, system):
         """Profile with hair_goals should be complete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {
             "hair_goals": ["hydration"],
         }
         
         assert system._is_profile_incomplete(profile) is False
     
-    def test_profile_with_skin_goals_is_complete(self):
+    def test_profile_with_skin_goals_is_complete(self, system):
         """Profile with skin_goals should be complete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {
             "skin_goals": ["hydration"],
         }
         
         assert system._is_profile_incomplete(profile) is False
     
-    def test_profile_with_household_strict_avoid_is_complete(self):
+    def test_profile_with_household_strict_avoid_is_complete(self, system):
         """Profile with household_strict_avoid should be complete."""
-        system = ForMeSystem(use_persistent_storage=False)
         profile = {
             "household_strict_avoid": ["bleach"],
         }
         
         assert system._is_profile_incomplete(profile) is False
-
+    
+    def test_each_completeness_key_makes_profile_complete(self, system):
+        """Any non-empty completeness field should make the profile complete."""
+        assert isinstance(ForMeSystem._COMPLETENESS_KEYS, frozenset)
+        for key in ForMeSystem._COMPLETENESS_KEYS:
+            assert system._is_profile_incomplete({key: ["value"]}) is False
+            assert system._is_profile_incomplete({key: []}) is True
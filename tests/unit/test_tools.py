@@ -3,9 +3,10 @@ Unit tests for tool functions (parsing, risk dictionary).
 """
 
 import pytest
+from src.tools import risk_dictionary
 from src.tools.ingredient_parser import parse_ingredients
-from src.tools.risk_dictionary import get_ingredient_risks
-from tests.conftest import mock_tool_context
+from src.tools.risk_dictionary import get_ingredient_risks, iter_ingredient_risks, keys_for_tag
+from src.tools.image_ocr import validate_image_format
 
 
 class TestIngredientParser:
@@ -73,6 +74,26 @@ class TestIngredientParser:
         result = parse_ingredients(mock_tool_context, "   \n\t  ")
         assert result["status"] == "error"
     
+    def test_duplicates_removed_in_order(self, mock_tool_context):
+        """Should drop repeated ingredients, keep first-seen order and report repeats."""
+        text = "water, glycerin, water, fragrance, glycerin"
+        result = parse_ingredients(mock_tool_context, text)
+        
+        assert result["status"] == "success"
+        assert result["ingredients"] == ["water", "glycerin", "fragrance"]
+        assert result["qa_metadata"]["duplicates_removed"] == ["water", "glycerin"]
+    
+    def test_repeated_text_returns_fresh_lists(self, mock_tool_context):
+        """Cached parses should not share result lists between calls."""
+        text = "water, glycerin, water"
+        first = parse_ingredients(mock_tool_context, text)
+        first["ingredients"].append("mutated")
+        first["qa_metadata"]["duplicates_removed"].clear()
+        
+        second = parse_ingredients(mock_tool_context, text)
+        assert second["ingredients"] == ["water", "glycerin"]
+        assert second["qa_metadata"]["duplicates_removed"] == ["water"]
+    
     def test_extract_parentheses_content(self, mock_tool_context):
         """Should extract important content from parentheses."""
         text = "flavoring substances (contains dairy derivatives)"
@@ -150,4 +171,94 @@ class TestRiskDictionary:
         assert result["status"] == "success"
         # Should find matches regardless of case
         assert len(result["risks"]) > 0
+    
+    def test_iter_matches_batch_lookup(self, mock_tool_context):
+        """Generator should yield the same tags as the batch tool."""
+        ingredients = ["Fragrance", "water", "sodium lauryl sulfate"]
+        result = get_ingredient_risks(mock_tool_context, ingredients)
+        
+        pairs = list(iter_ingredient_risks(ingredients))
+        assert [name for name, _ in pairs] == ingredients
+        assert {name: list(tags) for name, tags in pairs} == result["risks"]
+    
+    def test_repeated_list_returns_fresh_lists(self, mock_tool_context):
+        """Cached lookups should not share result lists between calls."""
+        ingredients = ["fragrance", "water"]
+        first = get_ingredient_risks(mock_tool_context, ingredients)
+        first["risks"]["fragrance"].append("mutated")
+        first["all_risk_tags"].clear()
+    
+        second = get_ingredient_risks(mock_tool_context, ingredients)
+        assert "mutated" not in second["risks"]["fragrance"]
+        assert "fragrance" in second["all_risk_tags"]
+    
+    @pytest.mark.parametrize("backend", ["automaton", "scan"])
+    def test_partial_match_backends_agree(self, mock_tool_context, monkeypatch, backend):
+        """Each partial-match backend should find the same tags as a brute-force scan."""
+        if backend == "automaton" and risk_dictionary._AUTOMATON is None:
+            pytest.skip("pyahocorasick is not installed")
+        if backend == "scan":
+            monkeypatch.setattr(risk_dictionary, "_AUTOMATON", None)
+        risk_dictionary._lookup_tags.cache_clear()
+        risk_dictionary._risks_cached.cache_clear()
+        
+        ingredients = [
+            "fragrance",                  # exact key
+            "sodium lauryl sulfate 30%",  # contains several keys
+            "sodium",                     # contained in keys
+            "water",                      # no risks
+            "соевый лецитин",             # Cyrillic ingredient
+            "краситель красный-40",       # contains a Cyrillic key
+            "yellow-5 lake",              # ASCII ingredient, key with a Cyrillic twin
+        ]
+        try:
+            result = get_ingredient_risks(mock_tool_context, ingredients)
+        finally:
+            risk_dictionary._lookup_tags.cache_clear()
+            risk_dictionary._risks_cached.cache_clear()
+        
+        for ingredient in ingredients:
+            name = ingredient.lower().strip()
+            if name in risk_dictionary.RISK_DICTIONARY:
+                expected = set(risk_dictionary.RISK_DICTIONARY[name])
+            else:
+                expected = {
+                    tag
+                    for key, tags in risk_dictionary.RISK_DICTIONARY.items()
+                    if key in name or name in key
+                    for tag in tags
+                }
+            assert set(result["risks"][ingredient]) == expected, ingredient
+    
+    def test_keys_for_tag(self):
+        """Inverse index should list keys carrying a tag."""
+        assert "fragrance" in keys_for_tag("fragrance")
+        assert keys_for_tag("sls") == {"sls", "sodium lauryl sulfate"}
+        assert keys_for_tag("no-such-tag") == frozenset()
 
+
+class TestValidateImageFormat:
+    """Tests for validate_image_format function."""
+    
+    def test_png_signature_detected(self):
+        """Should detect PNG from file signature."""
+        data = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+        result = validate_image_format(data, "image/png")
+        
+        assert result["status"] == "success"
+        assert result["mime_type"] == "image/png"
+    
+    def test_mismatched_mime_uses_detected_format(self):
+        """Should report the detected format, not the declared one."""
+        data = b"RIFF\x00\x00\x00\x00WEBP" + b"\x00" * 16
+        result = validate_image_format(data, "image/jpeg")
+        
+        assert result["status"] == "success"
+        assert result["mime_type"] == "image/webp"
+    
+    def test_unknown_signature_error(self):
+        """Should reject data that is not JPEG, PNG or WebP."""
+        result = validate_image_format(b"GIF89a" + b"\x00" * 16, "image/png")
+        
+        assert result["status"] == "error"
+        assert "error_message" in result
@@ -5,6 +5,7 @@ This module provides the main system initialization for deploying FOR ME
 on Cloud Run (FastAPI) or other platforms.
 """
 
+import functools
 import os
 import logging
 from typing import Dict, Any, Optional
@@ -15,16 +16,13 @@ from src.system import ForMeSystem
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize global system instance
-# Use persistent storage for production deployment
-_system: Optional[ForMeSystem] = None
-
-
+@functools.cache
 def get_system() -> ForMeSystem:
     """
     Get or create the global ForMeSystem instance.
     
-    Uses lazy initialization to avoid issues during import.
+    Uses lazy initialization to avoid issues during import. The instance is
+    created on the first call and cached for all subsequent calls.
     
     For Cloud Run deployment, uses in-memory storage by default.
     Set USE_PERSISTENT_STORAGE=true and DATABASE_URL for production database.
@@ -32,20 +30,28 @@ def get_system() -> ForMeSystem:
     Returns:
         ForMeSystem instance
     """
-    global _system
-    if _system is None:
-        # For Cloud Run, use in-memory by default (can be overridden with env vars)
-        # For production with database, set USE_PERSISTENT_STORAGE=true and DATABASE_URL
-        use_persistent = os.getenv("USE_PERSISTENT_STORAGE", "false").lower() == "true"
-        db_url = os.getenv("DATABASE_URL", "sqlite:///for_me_data.db")
-        
-        _system = ForMeSystem(
-            use_persistent_storage=use_persistent,
-            db_url=db_url,
-        )
-        logger.info(f"ForMeSystem initialized (persistent={use_persistent})")
+    # For Cloud Run, use in-memory by default (can be overridden with env vars)
+    # For production with database, set USE_PERSISTENT_STORAGE=true and DATABASE_URL
+    use_persistent = os.getenv("USE_PERSISTENT_STORAGE", "false").lower() == "true"
+    db_url = os.getenv("DATABASE_URL", "sqlite:///for_me_data.db")
+    
+    system = ForMeSystem(
+        use_persistent_storage=use_persistent,
+        db_url=db_url,
+    )
+    logger.info("ForMeSystem initialized (persistent=%s)", use_persistent)
     
-    return _system
+    return system
+
+
+def warmup() -> None:
+    """
+    Creates the ForMeSystem instance ahead of the first request.
+    
+    Called from the web server's startup hook so that a cold Cloud Run
+    instance does not pay the agent/storage setup on its first request.
+    """
+    get_system()
 
 
 async def handle_chat_request(
@@ -73,9 +79,10 @@ async def handle_chat_request(
     try:
         system = get_system()
         logger.info(
-            f"Chat request for user {user_id}, "
-            f"message_length={len(message or '')}, "
-            f"has_ingredients={bool(ingredient_text)}"
+            "Chat request for user %s, message_length=%d, has_ingredients=%s",
+            user_id,
+            len(message or ''),
+            bool(ingredient_text),
         )
         
         result = await system.handle_chat_request(
@@ -89,7 +96,7 @@ async def handle_chat_request(
         return result
         
     except Exception as e:
-        logger.error(f"Error processing chat request: {e}", exc_info=True)
+        logger.error("Error processing chat request: %s", e, exc_info=True)
         return {
             "status": "error",
             "error_message": str(e),